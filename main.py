@@ -124,12 +124,8 @@ class TradingBot:
             logger.info(f"📩 Message #{message_id} from {event.chat_id}: {preview}...")
             logger.debug(f"🔍 Telegram message ID: {event.message.id}, Database ID: {message_id}")
             
-            # Quick check
-            if not self.parser.is_signal_message(message_text):
-                return
-            
-            # Parse signal
-            signal = self.parser.parse(message_text)
+            # Quick check + parse signal (text is normalized once)
+            signal = self.parser.parse_message(message_text)
             if not signal:
                 return
             
@@ -6,22 +6,40 @@ Handles MT5 communication with async wrappers.
 
 import MetaTrader5 as mt5
 import logging
+import math
 from typing import Optional, Dict, Any, List
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import backoff
+from backoff.types import Details
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# Background reconnect backoff (seconds): 5, 10, 20, 40, then every 60
+_RECONNECT_INITIAL_DELAY = 5
+_RECONNECT_MAX_DELAY = 60
+
+
+def _log_reconnect_retry(details: Details) -> None:
+    """backoff on_backoff handler for the MT5 reconnect"""
+    logger.warning(f"MT5 reconnect failed - retrying in {details['wait']:.0f}s")
+
 
 class MT5Handler:
     """Async wrapper for MetaTrader 5"""
     
     def __init__(self):
         self.executor = ThreadPoolExecutor(max_workers=3)
+        # Reconnect attempts block for up to the 60s init timeout; keep them
+        # off the order workers
+        self._reconnect_executor = ThreadPoolExecutor(max_workers=1)
+        self._stopping = False  # Set by shutdown(); no reconnects after that
         self.initialized = False
         self._symbol_cache = {}  # Cache for validated symbols
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
     
     # === INITIALIZATION ===
     
@@ -64,6 +82,7 @@ class MT5Handler:
     async def initialize(self) -> bool:
         """Initialize MT5 (async)"""
         loop = asyncio.get_running_loop()
+        self._loop = loop  # Needed to schedule reconnects from executor threads
         return await loop.run_in_executor(self.executor, self._initialize_sync)
     
     def _shutdown_sync(self) -> None:
@@ -72,10 +91,69 @@ class MT5Handler:
         self.initialized = False
     
     async def shutdown(self) -> None:
-        """Shutdown MT5 (async)"""
+        """
+        Shutdown MT5 (async).
+        
+        Cancelling the reconnect task doesn't stop an mt5.initialize() already
+        running on the reconnect thread, so wait for it (up to its 60s
+        timeout) before mt5.shutdown(); otherwise it could reopen the
+        connection and set initialized back to True afterwards.
+        """
+        self._stopping = True
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
         loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._reconnect_executor.shutdown, True)
         await loop.run_in_executor(self.executor, self._shutdown_sync)
     
+    # === BACKGROUND RECONNECT ===
+    
+    def _schedule_reconnect(self) -> None:
+        """
+        Mark MT5 offline and start a background reconnect.
+        
+        Called from executor threads, so the task is created on the event loop
+        via call_soon_threadsafe. Orders fail fast while the reconnect runs
+        on its own thread instead of waiting out the 60s init timeout.
+        """
+        self.initialized = False
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._start_reconnect_task)
+    
+    def _start_reconnect_task(self) -> None:
+        """Start the reconnect task unless one is already running (event loop thread)"""
+        if self._stopping:
+            return
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.ensure_future(self._reconnect_loop())
+    
+    async def _reconnect_loop(self) -> None:
+        """Retry MT5 initialization with exponential backoff until connected"""
+        logger.warning("MT5 connection dead - attempting reconnect...")
+        if await self._reconnect_attempt() and not self._stopping:
+            logger.info("MT5 reconnected successfully")
+    
+    @backoff.on_predicate(
+        backoff.expo,
+        factor=_RECONNECT_INITIAL_DELAY,
+        max_value=_RECONNECT_MAX_DELAY,
+        jitter=None,
+        on_backoff=_log_reconnect_retry,
+        logger=None,  # _log_reconnect_retry logs each retry instead
+    )
+    async def _reconnect_attempt(self) -> bool:
+        """One MT5 init attempt on the reconnect thread (retried while False)"""
+        if self._stopping:
+            return True  # Stop retrying
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reconnect_executor, self._reconnect_sync)
+    
+    def _reconnect_sync(self) -> bool:
+        """_initialize_sync() for the reconnect thread, skipped once shutdown() has started"""
+        if self._stopping:
+            return False
+        return self._initialize_sync()
+    
     # === CONNECTION HEALTH CHECK ===
     
     def _check_connection_health(self) -> bool:
@@ -168,13 +246,9 @@ class MT5Handler:
         try:
             # === STEP 1: Verify MT5 connection is alive ===
             if not self._check_connection_health():
-                logger.warning("MT5 connection dead - attempting reconnect...")
-                self.initialized = False
-                
-                if not self._initialize_sync():
-                    return {'success': False, 'error': 'MT5 connection lost and reconnect failed'}
-                
-                logger.info("MT5 reconnected successfully")
+                logger.warning("MT5 connection dead - reconnecting in background")
+                self._schedule_reconnect()
+                return {'success': False, 'error': 'MT5 disconnected, reconnecting'}
             
             # === STEP 2: Validate symbol ===
             symbol_info = mt5.symbol_info(symbol)
@@ -274,40 +348,42 @@ class MT5Handler:
             if symbol_info is None:
                 return {'valid': False, 'error': f'Symbol {symbol} not found'}
             
-            # Calculate minimum stop distance
+            # Calculate minimum stop distance in whole points
             # CRITICAL: Even if stops_level = 0, add buffer for safety
             # NOTE: MT5 Python API uses 'trade_stops_level' not 'stops_level'
+            # Distances are compared as integer point counts so small-point
+            # symbols (e.g. JPY pairs) don't get rejected by float epsilon
             point = symbol_info.point
             stops_level = symbol_info.trade_stops_level
-            min_distance = max(stops_level, 10) * point * 1.5  # 50% buffer
+            min_stop_points = math.ceil(max(stops_level, 10) * 1.5)  # 50% buffer
             
             if action == 'BUY':
                 # BUY LIMIT: SL < Entry < TP
                 if sl is not None:
                     if sl >= entry_price:
                         return {'valid': False, 'error': f'BUY LIMIT: SL ({sl}) must be < Entry ({entry_price})'}
-                    if abs(entry_price - sl) < min_distance:
-                        return {'valid': False, 'error': f'SL too close to entry (min distance: {min_distance / point:.0f} points)'}
+                    if round(abs(entry_price - sl) / point) < min_stop_points:
+                        return {'valid': False, 'error': f'SL too close to entry (min distance: {min_stop_points} points)'}
                 
                 if tp is not None:
                     if tp <= entry_price:
                         return {'valid': False, 'error': f'BUY LIMIT: TP ({tp}) must be > Entry ({entry_price})'}
-                    if abs(tp - entry_price) < min_distance:
-                        return {'valid': False, 'error': f'TP too close to entry (min distance: {min_distance / point:.0f} points)'}
+                    if round(abs(tp - entry_price) / point) < min_stop_points:
+                        return {'valid': False, 'error': f'TP too close to entry (min distance: {min_stop_points} points)'}
             
             elif action == 'SELL':
                 # SELL LIMIT: TP < Entry < SL
                 if sl is not None:
                     if sl <= entry_price:
                         return {'valid': False, 'error': f'SELL LIMIT: SL ({sl}) must be > Entry ({entry_price})'}
-                    if abs(sl - entry_price) < min_distance:
-                        return {'valid': False, 'error': f'SL too close to entry (min distance: {min_distance / point:.0f} points)'}
+                    if round(abs(sl - entry_price) / point) < min_stop_points:
+                        return {'valid': False, 'error': f'SL too close to entry (min distance: {min_stop_points} points)'}
                 
                 if tp is not None:
                     if tp >= entry_price:
                         return {'valid': False, 'error': f'SELL LIMIT: TP ({tp}) must be < Entry ({entry_price})'}
-                    if abs(entry_price - tp) < min_distance:
-                        return {'valid': False, 'error': f'TP too close to entry (min distance: {min_distance / point:.0f} points)'}
+                    if round(abs(entry_price - tp) / point) < min_stop_points:
+                        return {'valid': False, 'error': f'TP too close to entry (min distance: {min_stop_points} points)'}
             
             return {'valid': True}
             
@@ -329,13 +405,9 @@ class MT5Handler:
         try:
             # === STEP 1: Verify MT5 connection is alive ===
             if not self._check_connection_health():
-                logger.warning("MT5 connection dead - attempting reconnect...")
-                self.initialized = False
-                
-                if not self._initialize_sync():
-                    return {'success': False, 'error': 'MT5 connection lost and reconnect failed'}
-                
-                logger.info("MT5 reconnected successfully")
+                logger.warning("MT5 connection dead - reconnecting in background")
+                self._schedule_reconnect()
+                return {'success': False, 'error': 'MT5 disconnected, reconnecting'}
             
             # === STEP 2: Validate symbol ===
             symbol_info = mt5.symbol_info(symbol)
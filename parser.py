@@ -11,17 +11,109 @@ SELL: "Sell XAUUSD .. Gold now ⬇️" + "Stop loss :4046.138" + "Take Profit:40
 
 import re
 import logging
+import operator
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, cast
 
 from symbol_resolver import SymbolResolver
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# === PRECOMPILED PATTERNS ===
+# Compiled once at import so the per-message hot path skips re's cache lookup
+
+# Spaced symbols: "XAU USD" → "XAUUSD" (specific pairs to avoid BUY/SELL collisions)
+# Metals: XAU USD, XAG USD. Majors: EUR USD, GBP USD, USD JPY, etc.
+# One alternation so the text is scanned once; unmatched groups substitute as ''
+_RE_SPACED_PAIR = re.compile(
+    r'\b(?:(XAU|XAG|EUR|GBP|AUD|NZD)\s+(USD)|(USD)\s+(JPY|CAD|CHF))\b'
+)
+
+# Standardize common variations
+_REPLACEMENTS = {
+    'STOP LOSS': 'SL',
+    'STOPLOSS': 'SL',
+    'STOP-LOSS': 'SL',
+    'TAKE PROFIT': 'TP',
+    'TAKEPROFIT': 'TP',
+    'TAKE-PROFIT': 'TP',
+    'TARGET': 'TP',
+    '..GOLD': '',      # Remove Gold suffix (e.g., "XAUUSD..Gold")
+    '.. GOLD': '',     # Remove Gold suffix with space (e.g., "XAUUSD .. Gold")
+    # Note: Don't remove 'GOLD NOW' - it could be the symbol itself!
+    # We'll let SymbolResolver handle GOLD → XAUUSD conversion
+}
+# Longest keys first so a shorter key never shadows a longer one
+_RE_REPLACEMENTS = re.compile(
+    '|'.join(re.escape(key) for key in sorted(_REPLACEMENTS, key=len, reverse=True))
+)
+# Actions: every whole-word action keyword in one scan (priority applied after)
+_RE_ACTION_WORD = re.compile(r'\b(?:BUY|LONG|SELL|SHORT)\b')
+
+# Order type / entry price
+_RE_AT_SIGN_PRICE = re.compile(r'[@]\s*(\d+\.?\d*)')
+_RE_AT_WORD = re.compile(r'\bAT\s+\d+\.?\d*')
+_RE_AT_WORD_PRICE = re.compile(r'\bAT\s+(\d+\.?\d+)')
+_RE_LIMIT_PRICE = re.compile(r'LIMIT\s+(\d+\.?\d+)')
+# Price written as \d+\.\d+|\d{2,} (same strings as \d+\.?\d+): with the required
+# terminator after it, the ambiguous form backtracks quadratically on long digit runs
+_RE_ACTION_SYMBOL_PRICE = re.compile(r'(BUY|SELL|LONG|SHORT)\s+[A-Z]+\s+(\d+\.\d+|\d{2,})(?:\s|,|$)')
+_RE_ENTRY_LABEL_PRICE = re.compile(r'(?:ENTRY|PRICE)[\s:]+(\d+\.?\d+)')
+
+# Stop loss / take profit, all found in one scan (see _extract_prices)
+# Each price captures: digits with optional commas, optional decimal part
+# Negative lookahead (?!\d) excludes TP1, TP2, TP3 but allows "TP 4519"
+# Leading (?=[ST]): every branch starts with S or T; stating it up front lets
+# the engine skip other positions cheaply (~2x faster scan, same matches)
+_RE_PRICES = re.compile(
+    r'(?=[ST])'
+    r'(?:(?P<tp1>TP\s*1[:\s–-]*(?P<tp1_price>[\d,]+(?:\.[\d]+)?))'
+    r'|(?P<tp>(?:TP|TAKE\s*PROFIT)(?!\d)[:\s–-]*(?P<tp_price>[\d,]+(?:\.[\d]+)?))'
+    r'|(?P<sl>(?:SL|STOP\s*LOSS)[:\s–-]*(?P<sl_price>[\d,]+(?:\.[\d]+)?)))'
+)
+# Plain TP on its own, for when TP1's value can't be converted
+_RE_TP = re.compile(r'(?:TP|TAKE\s*PROFIT)(?!\d)[:\s–-]*(?P<tp_price>[\d,]+(?:\.[\d]+)?)')
+
+
+# === PRICE CONVERSION ===
+def _price_to_float(price_str: str) -> float:
+    """Convert a captured SL/TP price to float, dropping thousands commas ("4,232.37" → 4232.37)"""
+    # Most prices have no comma; skip the replace() copy for those
+    return float(price_str if ',' not in price_str else price_str.replace(',', ''))
+
+
+# === SIGNAL CLASSIFICATION ===
+# Indexed by has_entry * 2 + has_params
+_SIGNAL_TYPES = ('INVALID', 'PARAMS_ONLY', 'ENTRY_ONLY', 'COMPLETE')
+
+
+def _classify_fields(action: Optional[str], symbol: Optional[str],
+                     stop_loss: Optional[float], take_profit: Optional[float]) -> str:
+    """Signal type for these fields (see SignalParser.classify_signal)"""
+    has_entry = (action is not None and symbol is not None)
+    has_params = (stop_loss is not None or take_profit is not None)
+    return _SIGNAL_TYPES[has_entry * 2 + has_params]
+
+
+# === LIMIT ORDER SL/TP RULES ===
+# action → (SL is invalid if, SL must be, TP is invalid if, TP must be), vs entry
+_LIMIT_SLTP_RULES = {
+    'BUY': (operator.ge, '<', operator.le, '>'),   # BUY LIMIT: SL < Entry < TP
+    'SELL': (operator.le, '>', operator.ge, '<'),  # SELL LIMIT: TP < Entry < SL
+}
+
+
+# === PARSE CACHE ===
+# Forwarded, edited and retried messages repeat the same text, and parsing is
+# pure given the text. Signal is frozen, so the cached instance is shared.
+_PARSE_CACHE_SIZE = 2048
+
+
+@dataclass(frozen=True, slots=True)
 class Signal:
-    """Parsed trading signal data"""
+    """Parsed trading signal data (immutable; parse results are cached and shared)"""
     action: Optional[str]              # BUY, SELL, or None
     symbol: Optional[str]              # e.g., XAUUSD, or None
     stop_loss: Optional[float] = None
@@ -35,27 +127,25 @@ class Signal:
     is_complete: bool = False          # True if has action+symbol+SL/TP
     signal_type: str = 'UNKNOWN'       # COMPLETE, ENTRY_ONLY, PARAMS_ONLY, INVALID
     
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validate signal data after initialization."""
         # Validate limit order requirements
-        if self.order_type == "LIMIT" and self.entry_price is None:
+        if self.order_type != "LIMIT":
+            return
+        if self.entry_price is None:
             raise ValueError("LIMIT order requires entry_price")
         
         # Validate SL/TP positioning for limit orders
-        if self.order_type == "LIMIT" and self.entry_price is not None:
-            if self.action == "BUY":
-                # BUY LIMIT: SL < Entry < TP
-                if self.stop_loss is not None and self.stop_loss >= self.entry_price:
-                    raise ValueError(f"BUY LIMIT: SL ({self.stop_loss}) must be < Entry ({self.entry_price})")
-                if self.take_profit is not None and self.take_profit <= self.entry_price:
-                    raise ValueError(f"BUY LIMIT: TP ({self.take_profit}) must be > Entry ({self.entry_price})")
-            
-            elif self.action == "SELL":
-                # SELL LIMIT: TP < Entry < SL
-                if self.stop_loss is not None and self.stop_loss <= self.entry_price:
-                    raise ValueError(f"SELL LIMIT: SL ({self.stop_loss}) must be > Entry ({self.entry_price})")
-                if self.take_profit is not None and self.take_profit >= self.entry_price:
-                    raise ValueError(f"SELL LIMIT: TP ({self.take_profit}) must be < Entry ({self.entry_price})")
+        if self.action is None:
+            return
+        rules = _LIMIT_SLTP_RULES.get(self.action)
+        if rules is None:
+            return
+        sl_invalid, sl_side, tp_invalid, tp_side = rules
+        if self.stop_loss is not None and sl_invalid(self.stop_loss, self.entry_price):
+            raise ValueError(f"{self.action} LIMIT: SL ({self.stop_loss}) must be {sl_side} Entry ({self.entry_price})")
+        if self.take_profit is not None and tp_invalid(self.take_profit, self.entry_price):
+            raise ValueError(f"{self.action} LIMIT: TP ({self.take_profit}) must be {tp_side} Entry ({self.entry_price})")
     
     def __str__(self) -> str:
         """Human-readable representation"""
@@ -75,22 +165,69 @@ class Signal:
 class SignalParser:
     """Parser for Mrbluemax Forex Academy trading signals"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         # No hardcoded symbols needed - SymbolResolver handles all symbol detection
-        pass
+        # Per instance, so overrides of the pipeline steps are honoured
+        self._parse_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(self._parse_uncached)
     
     def parse(self, message_text: str) -> Optional[Signal]:
         """
         Parse trading signal from Telegram message.
         
         Returns Signal if valid signal found, None otherwise.
+        
+        Results are memoized per parser by message text (_parse_cached);
+        repeats return the same (frozen) Signal. Only the "Parsed" line is
+        logged again on a repeat: the pipeline's warnings (validation
+        failure, missing SL/TP, symbol resolution) are logged the first
+        time a text is seen, and a repeated rejection returns None silently.
         """
         if not message_text:
             return None
+        return self._log_signal(self._parse_cached(message_text))
+    
+    def parse_message(self, message_text: str) -> Optional[Signal]:
+        """
+        Quick-check and parse a Telegram message in one call.
+        
+        Same result as `parse(text) if is_signal_message(text) else None`,
+        but the text is normalized once instead of twice. Preferred entry
+        point for the bot's message handler. Cached like parse().
+        """
+        if not message_text:
+            return None
+        return self._log_signal(self._parse_cached(message_text, require_signal=True))
+    
+    def _log_signal(self, signal: Optional[Signal]) -> Optional[Signal]:
+        """Log a (possibly cached) parse result and pass it through"""
+        if signal is None:
+            return None
+        
+        # Log parsed signal (INVALID never reaches here, so always one of
+        # COMPLETE / ENTRY_ONLY / PARAMS_ONLY)
+        logger.info("📍 Parsed %s: %s", signal.signal_type, signal)
+        
+        return signal
+    
+    def _parse_uncached(self, message_text: str, require_signal: bool = False) -> Optional[Signal]:
+        """
+        Run the full parsing pipeline (no caching, no success log).
         
+        Text without any action/SL/TP keyword is rejected before any regex
+        work; nothing without one can parse. With require_signal=True, also
+        returns None unless is_signal_message() would accept the text,
+        reusing the same normalized text for both.
+        """
         try:
             # === STEP 1: Clean and normalize text ===
-            text = self._normalize_text(message_text)
+            # Uppercase once; the quick check and normalization share it
+            text_upper = message_text.upper()
+            if not self._has_quick_trigger(text_upper):
+                return None
+            text = self._normalize_upper(text_upper)
+            
+            if require_signal and not self._is_signal_text(text):
+                return None
             
             # === STEP 2: Detect action type (BUY/SELL/LONG/SHORT) ===
             action = self._extract_action(text)
@@ -98,27 +235,23 @@ class SignalParser:
             # === STEP 3: Extract symbol ===
             symbol = self._extract_symbol(text)
             
-            # === STEP 4: Detect order type (MARKET/LIMIT) ===
-            order_type = self._extract_order_type(text)
-            
-            # === STEP 5: Extract entry price (for LIMIT orders) ===
+            # === STEP 4: Extract entry price (for LIMIT orders) ===
             entry_price = self._extract_entry_price(text)
             
-            # If entry price found but order_type is MARKET, switch to LIMIT
-            if entry_price is not None and order_type == 'MARKET':
-                # Check if there's an explicit MARKET keyword
-                if 'MARKET' not in text and 'NOW' not in text:
-                    order_type = 'LIMIT'
+            # === STEP 5: Detect order type (MARKET/LIMIT) ===
+            order_type = self._extract_order_type(text, entry_price)
             
             # === STEP 6: Extract Stop Loss and Take Profit ===
-            stop_loss = self._extract_price(text, 'SL')
-            take_profit = self._extract_price(text, 'TP')
+            stop_loss, take_profit = self._extract_prices(text)
             
-            # Log warnings for incomplete signals
-            if action and symbol and not stop_loss and not take_profit:
-                logger.warning(f"No stop loss found for {action} {symbol}")
+            # === STEP 7: Classify signal completeness ===
+            signal_type = _classify_fields(action, symbol, stop_loss, take_profit)
             
-            # === STEP 7: Create signal object ===
+            # Log warnings for incomplete signals (action + symbol, no SL/TP)
+            if signal_type == 'ENTRY_ONLY':
+                logger.warning("No stop loss found for %s %s", action, symbol)
+            
+            # === STEP 8: Create signal object ===
             try:
                 signal = Signal(
                     action=action,
@@ -126,38 +259,29 @@ class SignalParser:
                     stop_loss=stop_loss,
                     take_profit=take_profit,
                     order_type=order_type,
-                    entry_price=entry_price
+                    entry_price=entry_price,
+                    is_complete=(signal_type == 'COMPLETE'),
+                    signal_type=signal_type
                 )
             except ValueError as e:
                 # Validation error from __post_init__ (e.g., invalid SL/TP for LIMIT)
-                logger.warning(f"⚠️ Signal validation failed: {e}")
+                logger.warning("⚠️ Signal validation failed: %s", e)
                 return None
             
-            # === STEP 8: Classify signal completeness ===
-            signal.signal_type = self.classify_signal(signal)
-            
             # === STEP 9: Validate and return ===
             if signal.signal_type == 'INVALID':
-                logger.debug(f"Invalid signal - missing critical fields")
+                logger.debug("Invalid signal - missing critical fields")
                 return None
             
-            # Log parsed signal
-            if signal.signal_type == 'COMPLETE':
-                logger.info(f"📍 Parsed COMPLETE: {signal}")
-            elif signal.signal_type == 'ENTRY_ONLY':
-                logger.info(f"📍 Parsed ENTRY_ONLY: {signal}")
-            elif signal.signal_type == 'PARAMS_ONLY':
-                logger.info(f"📍 Parsed PARAMS_ONLY: {signal}")
-            
             return signal
             
         except Exception as e:
-            logger.error(f"Parsing error: {e}")
+            logger.error("Parsing error: %s", e)
             return None
     
     def classify_signal(self, signal: Signal) -> str:
         """
-        Classify signal completeness and update signal metadata.
+        Classify signal completeness.
         
         Returns:
             'COMPLETE', 'ENTRY_ONLY', 'PARAMS_ONLY', or 'INVALID'
@@ -167,60 +291,33 @@ class SignalParser:
             ENTRY_ONLY   = has action + symbol, missing SL/TP
             PARAMS_ONLY  = has SL/TP, missing action + symbol
             INVALID      = missing critical fields
+        
+        parse() classifies from its local fields before building the Signal,
+        so it doesn't call this; kept for callers holding a Signal. Signal is
+        frozen, so is_complete/signal_type are only set at construction.
         """
-        has_entry = (signal.action is not None and signal.symbol is not None)
-        has_params = (signal.stop_loss is not None or signal.take_profit is not None)
-        
-        if has_entry and has_params:
-            signal.is_complete = True
-            return 'COMPLETE'
-        elif has_entry and not has_params:
-            signal.is_complete = False
-            return 'ENTRY_ONLY'
-        elif not has_entry and has_params:
-            signal.is_complete = False
-            return 'PARAMS_ONLY'
-        else:
-            return 'INVALID'
+        return _classify_fields(signal.action, signal.symbol, signal.stop_loss, signal.take_profit)
     
     def _normalize_text(self, text: str) -> str:
         """Normalize message text for consistent parsing"""
         # Convert to uppercase for consistent matching
-        normalized = text.upper()
-        
+        return self._normalize_upper(text.upper())
+    
+    def _normalize_upper(self, normalized: str) -> str:
+        """_normalize_text() for text the caller has already uppercased"""
         # Normalize spaced symbols: "xau usd" → "XAUUSD", "EUR USD" → "EURUSD"
-        # Use specific patterns to avoid matching BUY/SELL with currency codes
-        # Metals: XAU USD, XAG USD
-        normalized = re.sub(r'\b(XAU)\s+(USD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(XAG)\s+(USD)\b', r'\1\2', normalized)
-        # Major currencies: EUR USD, GBP USD, USD JPY, etc.
-        normalized = re.sub(r'\b(EUR)\s+(USD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(GBP)\s+(USD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(USD)\s+(JPY)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(AUD)\s+(USD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(NZD)\s+(USD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(USD)\s+(CAD)\b', r'\1\2', normalized)
-        normalized = re.sub(r'\b(USD)\s+(CHF)\b', r'\1\2', normalized)
-        
-        # Standardize common variations
-        replacements = {
-            'STOP LOSS': 'SL',
-            'STOPLOSS': 'SL',
-            'STOP-LOSS': 'SL',
-            'TAKE PROFIT': 'TP',
-            'TAKEPROFIT': 'TP',
-            'TAKE-PROFIT': 'TP',
-            'TARGET': 'TP',
-            '..GOLD': '',      # Remove Gold suffix (e.g., "XAUUSD..Gold")
-            '.. GOLD': '',     # Remove Gold suffix with space (e.g., "XAUUSD .. Gold")
-            # Note: Don't remove 'GOLD NOW' - it could be the symbol itself!
-            # We'll let SymbolResolver handle GOLD → XAUUSD conversion
-        }
-        
-        for old, new in replacements.items():
-            normalized = normalized.replace(old, new)
-        
-        return normalized
+        # Every pair has USD on one side; the literal check skips the (much
+        # slower) regex scan on messages that can't contain one
+        if 'USD' in normalized:
+            normalized = _RE_SPACED_PAIR.sub(r'\1\2\3\4', normalized)
+        
+        # Standardize common variations (single pass, see _REPLACEMENTS)
+        # Every key contains one of these literals (keep in sync); without
+        # them (e.g. "BUY GOLD NOW", "TP 2700 SL 2650") the sub is a no-op
+        if not ('STOP' in normalized or 'TAKE' in normalized
+                or 'TARGET' in normalized or '..' in normalized):
+            return normalized
+        return _RE_REPLACEMENTS.sub(lambda m: _REPLACEMENTS[m.group(0)], normalized)
     
     def _extract_action(self, text: str) -> Optional[str]:
         """
@@ -230,48 +327,52 @@ class SignalParser:
         - BUY, SELL (standard)
         - LONG → BUY, SHORT → SELL (normalized)
         """
+        words = set(_RE_ACTION_WORD.findall(text))
+        
         # Check for BUY or LONG
-        if re.search(r'\bBUY\b', text):
+        if 'BUY' in words:
             return 'BUY'
-        if re.search(r'\bLONG\b', text):
+        if 'LONG' in words:
             return 'BUY'  # LONG → BUY normalization
         
         # Check for SELL or SHORT
-        if re.search(r'\bSELL\b', text):
+        if 'SELL' in words:
             return 'SELL'
-        if re.search(r'\bSHORT\b', text):
+        if 'SHORT' in words:
             return 'SELL'  # SHORT → SELL normalization
         
         return None
     
-    def _extract_order_type(self, text: str) -> str:
+    def _extract_order_type(self, text: str, entry_price: Optional[float]) -> str:
         """
         Detect LIMIT vs MARKET order type from signal text.
         
+        Takes the already-extracted entry price so the "@ 2655" and
+        "BUY EURUSD 1.0900" patterns aren't scanned a second time.
+        
         Returns:
             'LIMIT' or 'MARKET'
         """
         # Check for explicit MARKET keywords first
-        market_keywords = ['MARKET', 'NOW', 'IMMEDIATE', 'ASAP']
-        if any(keyword in text for keyword in market_keywords):
+        has_market_now = 'MARKET' in text or 'NOW' in text
+        if has_market_now or 'IMMEDIATE' in text or 'ASAP' in text:
+            # Entry price with only IMMEDIATE/ASAP (no MARKET/NOW) → still LIMIT
+            if entry_price is not None and not has_market_now:
+                return 'LIMIT'
             return 'MARKET'
         
         # Check for LIMIT indicators
         if 'LIMIT' in text:
             return 'LIMIT'
         
-        # Check for entry price pattern with @ or "at"
-        # Pattern: "@ 2655" or "AT 1.0900"
-        if re.search(r'[@]\s*\d+\.?\d*', text):
+        # Any entry price ("@ 2655", "AT 1.0900", "BUY EURUSD 1.0900", "ENTRY: 2655")
+        # indicates a limit order
+        if entry_price is not None:
             return 'LIMIT'
         
         # Check for "at" followed by price (but not "at loss" or "at profit")
-        if re.search(r'\bAT\s+\d+\.?\d*', text):
-            return 'LIMIT'
-        
-        # Check for price after action+symbol pattern: "BUY EURUSD 1.0900" or "SELL XAUUSD 2655"
-        # This pattern indicates a limit order with specific entry price
-        if re.search(r'(BUY|SELL|LONG|SHORT)\s+[A-Z]+\s+\d+\.?\d+(?:\s|,|$)', text):
+        # Looser than the entry price pattern: also catches single-digit "AT 5"
+        if _RE_AT_WORD.search(text):
             return 'LIMIT'
         
         # DEFAULT: No entry price or keywords → MARKET order
@@ -287,28 +388,28 @@ class SignalParser:
         CRITICAL: Returns float (not int) for MT5 compatibility
         """
         # Pattern 1: "@ 2655.50" or "@2655"
-        match = re.search(r'[@]\s*(\d+\.?\d*)', text)
+        match = _RE_AT_SIGN_PRICE.search(text)
         if match:
             return float(match.group(1))
         
         # Pattern 2: "at 1.0900" (but not "at loss" or "at profit")
-        match = re.search(r'\bAT\s+(\d+\.?\d+)', text)
+        match = _RE_AT_WORD_PRICE.search(text)
         if match:
             return float(match.group(1))
         
         # Pattern 3: "LIMIT 2655" or "limit 1.0900"
-        match = re.search(r'LIMIT\s+(\d+\.?\d+)', text)
+        match = _RE_LIMIT_PRICE.search(text)
         if match:
             return float(match.group(1))
         
         # Pattern 4: Price after action+symbol: "BUY EURUSD 1.0900" or "SELL XAUUSD 2655"
         # This finds price directly after the symbol
-        match = re.search(r'(BUY|SELL|LONG|SHORT)\s+[A-Z]+\s+(\d+\.?\d+)(?:\s|,|$)', text)
+        match = _RE_ACTION_SYMBOL_PRICE.search(text)
         if match:
             return float(match.group(2))
         
         # Pattern 5: "entry: 1.0900" or "price: 2655"
-        match = re.search(r'(?:ENTRY|PRICE)[\s:]+(\d+\.?\d+)', text)
+        match = _RE_ENTRY_LABEL_PRICE.search(text)
         if match:
             return float(match.group(1))
         
@@ -329,12 +430,12 @@ class SignalParser:
         # Single source of truth for symbol resolution
         symbol = SymbolResolver.resolve(text)
         if symbol:
-            logger.info(f"🔍 Resolved symbol: {symbol}")
+            logger.info("🔍 Resolved symbol: %s", symbol)
         return symbol
     
-    def _extract_price(self, text: str, price_type: str) -> Optional[float]:
+    def _extract_prices(self, text: str) -> Tuple[Optional[float], Optional[float]]:
         """
-        Extract price value for SL or TP with multiple format support.
+        Extract (stop_loss, take_profit) in a single pass with multiple format support.
 
         Handles various formats:
         - "SL: 4014.427" / "sl: 4014.427"
@@ -346,45 +447,50 @@ class SignalParser:
         - "SL - 4,232.37" (comma thousand separator)
         - "TP - 4,205.58" (comma thousand separator)
         - "TP1 2645 TP2 2640 TP3 2635" (numbered TPs - use TP1 only)
-        """
-        text_upper = text.upper()
 
-        # Build pattern based on price type
-        # Pattern captures: digits with optional commas, optional decimal part
+        Expects normalized (uppercased) text, as produced by _normalize_text.
+        """
+        # Every _RE_PRICES branch starts with one of these; entry-only
+        # messages ("BUY GOLD NOW") skip the regex scan entirely
+        if not ('TP' in text or 'SL' in text or 'STOP' in text or 'TAKE' in text):
+            return None, None
+        # Keep the first match of each kind; stop once SL and TP1 are both known
         # Examples: "4232.37", "4,232.37", "80000", "80,000"
-        if price_type.upper() == 'TP':
-            # NEW: Check for numbered TPs first (TP1, TP2, TP3)
-            # Use TP1 only for simplicity
-            tp1_match = re.search(r'TP\s*1\s*[:\s–-]*\s*([\d,]+(?:\.[\d]+)?)', text_upper)
-            if tp1_match:
-                try:
-                    price_str = tp1_match.group(1).replace(',', '')
-                    return float(price_str)
-                except ValueError:
-                    pass
-            
-            # Fallback: Match TP without number (original pattern)
-            # Match: TP, tp, take profit, Take Profit, TAKE PROFIT
-            # Use negative lookahead (?!\d) to exclude TP1, TP2, TP3 (number directly after TP)
-            # But allow "TP 4519" (space between TP and price)
-            pattern = r'(?:TP|TAKE\s*PROFIT)(?!\d)\s*[:\s–-]*\s*([\d,]+(?:\.[\d]+)?)'
-        elif price_type.upper() == 'SL':
-            # Match: SL, sl, stop loss, Stop Loss, STOP LOSS
-            pattern = r'(?:SL|STOP\s*LOSS)\s*[:\s–-]*\s*([\d,]+(?:\.[\d]+)?)'
-        else:
-            return None
+        found: Dict[str, re.Match[str]] = {}
+        for match in _RE_PRICES.finditer(text):
+            # lastgroup is always the outer branch name: 'tp1', 'tp' or 'sl'
+            found.setdefault(cast(str, match.lastgroup), match)
+            if 'sl' in found and 'tp1' in found:
+                break
 
-        match = re.search(pattern, text_upper, re.IGNORECASE)
-        if match:
+        stop_loss = self._match_to_price(found.get('sl'), 'SL')
+
+        # NEW: Numbered TPs (TP1, TP2, TP3) take priority - use TP1 only
+        take_profit = None
+        tp_match = found.get('tp')
+        if 'tp1' in found:
             try:
-                # Remove commas before converting to float (handles "4,232.37" → "4232.37")
-                price_str = match.group(1).replace(',', '')
-                return float(price_str)
+                take_profit = _price_to_float(found['tp1'].group('tp1_price'))
             except ValueError:
-                logger.warning(f"Failed to convert '{match.group(1)}' to float for {price_type}")
-                return None
+                # Fallback: first TP without number, wherever it is
+                tp_match = _RE_TP.search(text)
 
-        return None
+        if take_profit is None:
+            # Match: TP, tp, take profit, Take Profit, TAKE PROFIT
+            take_profit = self._match_to_price(tp_match, 'TP')
+
+        return stop_loss, take_profit
+    
+    def _match_to_price(self, match: Optional[re.Match], price_type: str) -> Optional[float]:
+        """Convert a SL/TP price match to float (None if missing or invalid)"""
+        if match is None:
+            return None
+        price_str = match.group(f'{price_type.lower()}_price')
+        try:
+            return _price_to_float(price_str)
+        except ValueError:
+            logger.warning("Failed to convert '%s' to float for %s", price_str, price_type)
+            return None
     
     def is_signal_message(self, message_text: str) -> bool:
         """
@@ -400,44 +506,54 @@ class SignalParser:
         if not message_text:
             return False
         
+        # Cheap prefilter on the raw text: most chat messages contain no action
+        # or SL/TP trigger at all, so skip normalization for them entirely
+        text_upper = message_text.upper()
+        if not self._has_quick_trigger(text_upper):
+            return False
+        
         # Normalize text first (same as parse() does)
         # This converts STOPLOSS→SL, TAKEPROFIT→TP, etc.
-        text_normalized = self._normalize_text(message_text)
-        
-        # Check for action keywords (BUY, SELL, LONG, SHORT)
-        has_action = any(word in text_normalized for word in ['BUY', 'SELL', 'LONG', 'SHORT'])
-        
-        # Check for symbol-like pattern (2-10 uppercase letters, optional _xN suffix)
-        has_symbol = bool(re.search(r'[A-Z]{2,10}(?:_x\d+)?', text_normalized))
-        
-        # Check for common symbol aliases (expanded list)
-        has_alias = any(alias in text_normalized for alias in [
-            'GOLD', 'SILVER', 'PLATINUM', 'PALLADIUM', 'COPPER', 'ALUMINUM',
-            'BITCOIN', 'BTC', 'ETH', 'ETHEREUM', 'LITECOIN', 'RIPPLE', 'CARDANO', 'SOLANA',
-            'EUR', 'GBP', 'JPY', 'AUD', 'NZD', 'CAD', 'CHF',
-            'CABLE', 'FIBER', 'AUSSIE', 'KIWI', 'LOONIE', 'SWISSIE', 'GOPHER',
-            'OIL', 'CRUDE', 'BRENT', 'GAS', 'NATGAS',
-            'DOW', 'NASDAQ', 'SPX', 'FTSE', 'DAX', 'NIKKEI'
-        ])
+        return self._is_signal_text(self._normalize_upper(text_upper))
+    
+    def _has_quick_trigger(self, text_upper: str) -> bool:
+        """Check uppercased raw text for any keyword a signal must contain"""
+        # A message can only pass is_signal_message, or parse at all, with an
+        # action or SL/TP keyword (STOP/TAKE/TARGET are the pre-normalization
+        # forms of SL/TP)
+        return ('BUY' in text_upper or 'SELL' in text_upper
+                or 'LONG' in text_upper or 'SHORT' in text_upper
+                or 'SL' in text_upper or 'TP' in text_upper
+                or 'STOP' in text_upper or 'TAKE' in text_upper
+                or 'TARGET' in text_upper)
+    
+    def _is_signal_text(self, text_normalized: str) -> bool:
+        """is_signal_message() check on already-normalized text"""
+        # Signal is valid if:
+        # 1. Has params (TP/SL), OR
+        # 2. Has action + (symbol OR alias)
+        # The action keyword is itself a run of uppercase letters, so it always
+        # satisfies the loose symbol-shape test ([A-Z]{2,10}); 2. therefore
+        # reduces to "has action", and no symbol/alias scan is needed here.
+        # SignalParser.parse() does the real symbol resolution.
         
         # Check for TP/SL keywords (now simplified - normalization already converted variants)
-        has_params = 'TP' in text_normalized or 'SL' in text_normalized
+        if 'TP' in text_normalized or 'SL' in text_normalized:
+            return True
         
-        # Signal is valid if:
-        # 1. Has action + (symbol OR alias), OR
-        # 2. Has params (TP/SL)
-        return (has_action and (has_symbol or has_alias)) or has_params
+        # Check for action keywords (BUY, SELL, LONG, SHORT)
+        return ('BUY' in text_normalized or 'SELL' in text_normalized
+                or 'LONG' in text_normalized or 'SHORT' in text_normalized)
 
 
 # === TESTING UTILITY ===
 def test_parser():
     """Test parser with sample signals"""
     import sys
-    import io
     
-    # Fix Windows console encoding for emojis
-    if sys.platform == 'win32':
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    # Fix Windows console encoding for emojis (reuses the existing buffer)
+    if sys.platform == 'win32' and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     
     parser = SignalParser()
     
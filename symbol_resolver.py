@@ -13,6 +13,8 @@ Supports:
 
 import re
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -24,7 +26,8 @@ class SymbolResolver:
     Maps common names and aliases to official MT5 symbols.
     """
     
-    ALIAS_MAP = {
+    # Read-only: ALIAS_PATTERN and ALIAS_RANK below are derived from it once
+    ALIAS_MAP = MappingProxyType({
         # === PRECIOUS METALS ===
         'GOLD': 'XAUUSD',
         'XAU': 'XAUUSD',
@@ -109,24 +112,36 @@ class SymbolResolver:
         'HSI': 'HK50',
         'STOXX': 'STOXX50',
         'EUROSTOXX': 'STOXX50',
-    }
+    })
     
     # Known valid symbols that are too short for pattern matching (4-5 chars)
     # These are validated directly to avoid false positives
     # NOTE: Must be uppercase to match text.upper() in resolve()
-    KNOWN_SHORT_SYMBOLS = {
+    KNOWN_SHORT_SYMBOLS = frozenset({
         'US30', 'US500', 'UK100', 'DE30', 'FR40', 'JP225', 'HK50',
         'USTEC', 'AUS200', 'STOXX50', 'UKOIL', 'USOIL',
         'US30_X10', 'USTEC_X100', 'US500_X100',  # Amplified indices (uppercase X!)
-    }
+    })
+    
+    # Common signal words that match SYMBOL_PATTERN but are never symbols
+    NON_SYMBOL_WORDS = frozenset({
+        'BUY', 'SELL', 'LONG', 'SHORT', 'NOW', 'STOP', 'LOSS', 'TAKE', 'PROFIT',
+        'MARKET', 'LIMIT', 'THE', 'AND', 'FOR', 'WITH', 'FROM', 'THIS', 'THAT',
+        'HAVE', 'WILL', 'JUST', 'MESSAGE', 'ENTRY', 'PRICE', 'TARGET',
+    })
     
     # Symbol pattern: 2-10 uppercase letters/numbers, optional _xN or _XN suffix for amplified indices
     # Handles: EURUSD, XAUUSD, US30, UK100, US30_x10, USTEC_x100
     # NOTE: [xX] to match both lowercase and uppercase x (text.upper() converts _x to _X)
     SYMBOL_PATTERN = re.compile(r'\b([A-Z0-9]{2,10}(?:_[xX]\d+)?)\b')
     
-    # Cached validated symbols (class-level)
-    _validated_cache: set = set()
+    # All aliases as one word-boundary alternation (longest first), so the text
+    # is scanned once. When several aliases appear, the one listed first in
+    # ALIAS_MAP wins (ALIAS_RANK), not the leftmost one in the text.
+    ALIAS_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(re.escape(alias) for alias in sorted(ALIAS_MAP, key=len, reverse=True)) + r')\b'
+    )
+    ALIAS_RANK = {alias: rank for rank, alias in enumerate(ALIAS_MAP)}
     
     @classmethod
     def resolve(cls, text: str, mt5_handler=None) -> Optional[str]:
@@ -150,35 +165,35 @@ class SymbolResolver:
             resolve("BUY BTC") → "BTCUSD"
             resolve("BUY US30_x10") → "US30_x10"
             resolve("SELL EURUSD") → "EURUSD"
-        """
-        text_upper = text.upper()
         
+        Results are memoized per uppercased text (see _resolve_cached).
+        """
+        return _resolve_cached(text.upper())
+    
+    @classmethod
+    def _resolve_uncached(cls, text_upper: str) -> Optional[str]:
+        """Run the resolution pipeline on uppercased text (no caching)"""
         # === STEP 1: Alias Resolution ===
-        for alias, official in cls.ALIAS_MAP.items():
-            # Word boundary match to avoid false positives
-            if re.search(rf'\b{alias}\b', text_upper):
-                logger.info(f"🔍 Resolved alias: '{alias}' → '{official}'")
-                return official
+        # Word boundary match to avoid false positives
+        found = {match.group(0) for match in cls.ALIAS_PATTERN.finditer(text_upper)}
+        if found:
+            alias = min(found, key=cls.ALIAS_RANK.__getitem__)
+            official = cls.ALIAS_MAP[alias]
+            logger.info("🔍 Resolved alias: '%s' → '%s'", alias, official)
+            return official
         
         # === STEP 2: Pattern Extraction ===
-        matches = cls.SYMBOL_PATTERN.findall(text_upper)
-        
-        for symbol in matches:
+        # finditer: most messages resolve on an early match, so don't build the full list
+        for match in cls.SYMBOL_PATTERN.finditer(text_upper):
+            symbol = match.group(1)
+            
             # Skip common non-symbol words
-            if symbol in {'BUY', 'SELL', 'LONG', 'SHORT', 'NOW', 'STOP', 'LOSS', 'TAKE', 'PROFIT', 
-                          'MARKET', 'LIMIT', 'THE', 'AND', 'FOR', 'WITH', 'FROM', 'THIS', 'THAT', 
-                          'HAVE', 'WILL', 'JUST', 'MESSAGE', 'ENTRY', 'PRICE', 'TARGET'}:
+            if symbol in cls.NON_SYMBOL_WORDS:
                 continue
             
-            # Check cache for previously validated symbols
-            if symbol in cls._validated_cache:
-                logger.debug(f"🎯 Cached symbol: {symbol}")
-                return symbol
-            
             # Check known short symbols (indices, amplified)
             if symbol in cls.KNOWN_SHORT_SYMBOLS:
-                logger.debug(f"🎯 Known symbol: {symbol}")
-                cls._validated_cache.add(symbol)
+                logger.debug("🎯 Known symbol: %s", symbol)
                 return symbol
             
             # For offline mode or when MT5 handler not provided:
@@ -188,8 +203,20 @@ class SymbolResolver:
             # Crypto: 6 chars (BTCUSD, ETHUSD)
             # Exotics: 6 chars (USDTRY, EURZAR)
             if len(symbol) >= 6:  # Standard symbol length
-                logger.debug(f"🎯 Pattern-matched symbol: {symbol}")
-                cls._validated_cache.add(symbol)  # Cache for future
+                logger.debug("🎯 Pattern-matched symbol: %s", symbol)
                 return symbol
         
         return None
+
+
+# === RESOLVE CACHE ===
+# Channels reuse the same signal templates, and resolution depends only on the
+# text (it consults no external state). Bounded, unlike the per-symbol set of
+# validated symbols it replaces.
+_RESOLVE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+def _resolve_cached(text_upper: str) -> Optional[str]:
+    """SymbolResolver._resolve_uncached() memoized by uppercased text"""
+    return SymbolResolver._resolve_uncached(text_upper)
@@ -8,9 +8,9 @@ Run with: pytest trading_bot/test_limit_orders.py -v
 
 import pytest
 import sqlite3
-import tempfile
 import os
 import sys
+from dataclasses import FrozenInstanceError
 
 # Add trading_bot to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -18,54 +18,54 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from parser import SignalParser, Signal
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One SignalParser shared by the module (it keeps no per-message state)"""
+    return SignalParser()
+
+
 class TestLongShortNormalization:
     """Test 1: LONG/SHORT normalization"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_long_normalizes_to_buy(self):
+    def test_long_normalizes_to_buy(self, parser):
         """Verify LONG → BUY conversion."""
-        signal = self.parser.parse("Long market xau usd Sl - 4462 Tp1 -4401")
+        signal = parser.parse("Long market xau usd Sl - 4462 Tp1 -4401")
         assert signal is not None
         assert signal.action == "BUY", "LONG should normalize to BUY"
     
-    def test_short_normalizes_to_sell(self):
+    def test_short_normalizes_to_sell(self, parser):
         """Verify SHORT → SELL conversion."""
-        signal = self.parser.parse("Short market xau usd Sl - 4462 Tp1 -4401")
+        signal = parser.parse("Short market xau usd Sl - 4462 Tp1 -4401")
         assert signal is not None
         assert signal.action == "SELL", "SHORT should normalize to SELL"
     
-    def test_case_insensitive_long(self):
+    @pytest.mark.parametrize("text", ["LONG XAUUSD", "long XAUUSD", "Long XAUUSD"])
+    def test_case_insensitive_long(self, parser, text):
         """Verify case-insensitive LONG detection."""
-        for text in ["LONG XAUUSD", "long XAUUSD", "Long XAUUSD"]:
-            signal = self.parser.parse(f"{text} SL 2650 TP 2700")
-            assert signal is not None
-            assert signal.action == "BUY", f"'{text}' should normalize to BUY"
+        signal = parser.parse(f"{text} SL 2650 TP 2700")
+        assert signal is not None
+        assert signal.action == "BUY", f"'{text}' should normalize to BUY"
     
-    def test_case_insensitive_short(self):
+    @pytest.mark.parametrize("text", ["SHORT XAUUSD", "short XAUUSD", "Short XAUUSD"])
+    def test_case_insensitive_short(self, parser, text):
         """Verify case-insensitive SHORT detection."""
-        for text in ["SHORT XAUUSD", "short XAUUSD", "Short XAUUSD"]:
-            signal = self.parser.parse(f"{text} SL 2700 TP 2650")
-            assert signal is not None
-            assert signal.action == "SELL", f"'{text}' should normalize to SELL"
+        signal = parser.parse(f"{text} SL 2700 TP 2650")
+        assert signal is not None
+        assert signal.action == "SELL", f"'{text}' should normalize to SELL"
 
 
 class TestSpacedSymbolNormalization:
     """Test 2: Spaced symbol normalization"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_xau_usd_normalization(self):
+    def test_xau_usd_normalization(self, parser):
         """Verify 'xau usd' → 'XAUUSD' normalization."""
-        signal = self.parser.parse("Buy xau usd @ 2650 SL 2640 TP 2660")
+        signal = parser.parse("Buy xau usd @ 2650 SL 2640 TP 2660")
         assert signal is not None
         assert signal.symbol == "XAUUSD", "Spaced symbols should be normalized"
     
-    def test_eur_usd_normalization(self):
+    def test_eur_usd_normalization(self, parser):
         """Verify 'eur usd' → 'EURUSD' normalization."""
-        signal = self.parser.parse("Short eur usd market SL 1.10 TP 1.05")
+        signal = parser.parse("Short eur usd market SL 1.10 TP 1.05")
         assert signal is not None
         assert signal.symbol == "EURUSD", "EUR USD should normalize to EURUSD"
 
@@ -73,26 +73,23 @@ class TestSpacedSymbolNormalization:
 class TestLimitOrderDetection:
     """Test 3: LIMIT order type detection"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_explicit_limit_keyword(self):
+    def test_explicit_limit_keyword(self, parser):
         """Verify LIMIT keyword detection."""
-        signal = self.parser.parse("XAUUSD Buy Limit 4477, Sl 4473, Tp 4519")
+        signal = parser.parse("XAUUSD Buy Limit 4477, Sl 4473, Tp 4519")
         assert signal is not None
         assert signal.order_type == "LIMIT"
         assert signal.entry_price == 4477.0
     
-    def test_at_symbol_detection(self):
+    def test_at_symbol_detection(self, parser):
         """Verify @ symbol indicates LIMIT order."""
-        signal = self.parser.parse("SELL EURUSD @ 1.0950 SL 1.0970 TP 1.0920")
+        signal = parser.parse("SELL EURUSD @ 1.0950 SL 1.0970 TP 1.0920")
         assert signal is not None
         assert signal.order_type == "LIMIT"
         assert signal.entry_price == 1.0950
     
-    def test_at_keyword_detection(self):
+    def test_at_keyword_detection(self, parser):
         """Verify 'at' keyword indicates LIMIT order."""
-        signal = self.parser.parse("BUY EURUSD at 1.0900 SL 1.0850 TP 1.0950")
+        signal = parser.parse("BUY EURUSD at 1.0900 SL 1.0850 TP 1.0950")
         assert signal is not None
         assert signal.order_type == "LIMIT"
 
@@ -100,25 +97,22 @@ class TestLimitOrderDetection:
 class TestMarketOrderDetection:
     """Test 4: MARKET order type detection"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_explicit_market_keyword(self):
+    def test_explicit_market_keyword(self, parser):
         """Verify MARKET keyword detection."""
-        signal = self.parser.parse("Buy EURUSD MARKET SL 1.0850 TP 1.0950")
+        signal = parser.parse("Buy EURUSD MARKET SL 1.0850 TP 1.0950")
         assert signal is not None
         assert signal.order_type == "MARKET"
         assert signal.entry_price is None
     
-    def test_now_keyword_detection(self):
+    def test_now_keyword_detection(self, parser):
         """Verify NOW keyword indicates MARKET order."""
-        signal = self.parser.parse("SELL XAUUSD NOW SL 2660 TP 2640")
+        signal = parser.parse("SELL XAUUSD NOW SL 2660 TP 2640")
         assert signal is not None
         assert signal.order_type == "MARKET"
     
-    def test_default_to_market(self):
+    def test_default_to_market(self, parser):
         """Verify default to MARKET when no entry price keywords."""
-        signal = self.parser.parse("BUY XAUUSD SL 2640 TP 2660")
+        signal = parser.parse("BUY XAUUSD SL 2640 TP 2660")
         assert signal is not None
         assert signal.order_type == "MARKET"
 
@@ -126,18 +120,15 @@ class TestMarketOrderDetection:
 class TestMultiTPParsing:
     """Test 5: Multi-TP parsing (use TP1 only)"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_use_tp1_only(self):
+    def test_use_tp1_only(self, parser):
         """Verify TP1, TP2, TP3 extraction with TP1 prioritization."""
-        signal = self.parser.parse("SELL XAUUSD @ 2655 SL 2665 TP1 2645 TP2 2640 TP3 2635")
+        signal = parser.parse("SELL XAUUSD @ 2655 SL 2665 TP1 2645 TP2 2640 TP3 2635")
         assert signal is not None
         assert signal.take_profit == 2645.0, "Should use TP1 value only"
     
-    def test_multi_tp_with_market_order(self):
+    def test_multi_tp_with_market_order(self, parser):
         """Verify multi-TP works with MARKET orders."""
-        signal = self.parser.parse("Short market xau usd Sl - 4462 Tp1 -4401 Tp2 -4243")
+        signal = parser.parse("Short market xau usd Sl - 4462 Tp1 -4401 Tp2 -4243")
         assert signal is not None
         assert signal.take_profit == 4401.0, "Should use TP1 value (4401)"
 
@@ -227,67 +218,55 @@ class TestSellLimitValidation:
 class TestDatabaseMigration:
     """Test 8: Database migration"""
     
-    def test_order_type_column_added(self):
+    def test_order_type_column_added(self, tmp_path):
         """Verify order_type column is added by migration."""
-        # Create temporary database
-        fd, db_path = tempfile.mkstemp(suffix='.db')
-        os.close(fd)
+        db_path = str(tmp_path / "signals.db")
+        
+        # Create database with old schema (messages table for foreign key)
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE signals (
+                id INTEGER PRIMARY KEY,
+                message_id INTEGER,
+                timestamp TEXT,
+                action TEXT,
+                symbol TEXT,
+                stop_loss REAL,
+                take_profit REAL,
+                status TEXT,
+                mt5_ticket INTEGER,
+                error_message TEXT
+            );
+            CREATE TABLE messages (
+                id INTEGER PRIMARY KEY,
+                channel_id INTEGER,
+                telegram_msg_id INTEGER,
+                timestamp TEXT,
+                raw_message TEXT
+            );
+        """)
+        
+        # Import and initialize Database (should run migration)
+        from db_utils import Database
+        db = Database(db_path)
         
-        try:
-            # Create database with old schema
-            conn = sqlite3.connect(db_path)
-            conn.execute("""
-                CREATE TABLE signals (
-                    id INTEGER PRIMARY KEY,
-                    message_id INTEGER,
-                    timestamp TEXT,
-                    action TEXT,
-                    symbol TEXT,
-                    stop_loss REAL,
-                    take_profit REAL,
-                    status TEXT,
-                    mt5_ticket INTEGER,
-                    error_message TEXT
-                )
-            """)
-            # Create messages table for foreign key
-            conn.execute("""
-                CREATE TABLE messages (
-                    id INTEGER PRIMARY KEY,
-                    channel_id INTEGER,
-                    telegram_msg_id INTEGER,
-                    timestamp TEXT,
-                    raw_message TEXT
-                )
-            """)
-            conn.commit()
-            
-            # Import and initialize Database (should run migration)
-            from db_utils import Database
-            db = Database(db_path)
-            
-            # Check columns exist
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info('signals')")
-            columns = [row[1] for row in cursor.fetchall()]
-            
-            assert 'order_type' in columns, "order_type column should be added"
-            assert 'entry_price' in columns, "entry_price column should be added"
-            
-            conn.close()
-        finally:
-            os.unlink(db_path)
+        # Check columns exist
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info('signals')")
+        columns = [row[1] for row in cursor.fetchall()]
+        
+        assert 'order_type' in columns, "order_type column should be added"
+        assert 'entry_price' in columns, "entry_price column should be added"
+        
+        conn.close()
 
 
 class TestBackwardsCompatibility:
     """Test 9: Backwards compatibility - existing signals"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_blue_max_format(self):
+    def test_blue_max_format(self, parser):
         """Verify Blue Max Forex Academy format still works."""
-        signal = self.parser.parse("""
+        signal = parser.parse("""
             Buy XAUUSD .. Gold now !
             Stop loss : 4014.427
             Take profit : 4055.964
@@ -296,12 +275,12 @@ class TestBackwardsCompatibility:
         assert signal.action == "BUY"
         assert signal.order_type == "MARKET"  # Should default to MARKET
         assert signal.entry_price is None
-        assert abs(signal.stop_loss - 4014.427) < 0.01
-        assert abs(signal.take_profit - 4055.964) < 0.01
+        assert signal.stop_loss == pytest.approx(4014.427, abs=0.01)
+        assert signal.take_profit == pytest.approx(4055.964, abs=0.01)
     
-    def test_cobalt_smc_format(self):
+    def test_cobalt_smc_format(self, parser):
         """Verify Cobalt SMC format still works."""
-        signal = self.parser.parse("""
+        signal = parser.parse("""
             SELL GOLD NOW
             SL - 4,232.37
             TP - 4,205.58
@@ -309,34 +288,84 @@ class TestBackwardsCompatibility:
         assert signal is not None
         assert signal.action == "SELL"
         assert signal.order_type == "MARKET"
-        assert abs(signal.stop_loss - 4232.37) < 0.01
-        assert abs(signal.take_profit - 4205.58) < 0.01
+        assert signal.stop_loss == pytest.approx(4232.37, abs=0.01)
+        assert signal.take_profit == pytest.approx(4205.58, abs=0.01)
 
 
 class TestEntryPriceFloatConversion:
     """Test 10: Entry price float conversion"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_entry_price_is_float(self):
+    def test_entry_price_is_float(self, parser):
         """Verify entry prices are always float, never int."""
-        signal = self.parser.parse("BUY EURUSD @ 1 SL 0.99 TP 1.01")
+        signal = parser.parse("BUY EURUSD @ 1 SL 0.99 TP 1.01")
         
         # CRITICAL: Must be float for MT5
         if signal and signal.entry_price is not None:
             assert isinstance(signal.entry_price, float), "entry_price must be float"
 
 
+class TestParseCache:
+    """Test 11: Repeated messages are served from the parse cache"""
+
+    def test_repeat_parse_returns_cached_signal(self, parser):
+        """Verify repeats share one frozen Signal that callers can't corrupt."""
+        text = "SELL XAUUSD @ 2655 SL 2665 TP1 2645 TP2 2640"
+        first = parser.parse(text)
+        with pytest.raises(FrozenInstanceError):
+            first.stop_loss = 0.0  # Would otherwise leak into the cache
+
+        second = parser.parse(text)
+        assert second is first
+        assert second.stop_loss == 2665.0
+        assert second.order_type == "LIMIT"
+        assert second.signal_type == "COMPLETE"
+
+    def test_cache_honours_subclass_overrides(self, parser):
+        """Verify a subclass's pipeline step is used, not a shared cache entry."""
+        class EurOnlyParser(SignalParser):
+            def _extract_symbol(self, text):
+                return "EURUSD"
+
+        text = "BUY XAUUSD SL 2650 TP 2700"
+        assert parser.parse(text).symbol == "XAUUSD"
+        assert EurOnlyParser().parse(text).symbol == "EURUSD"
+
+
+class TestParseMessage:
+    """Test 12: parse_message() == parse() gated by is_signal_message()"""
+
+    @pytest.mark.parametrize("text,signal_type", [
+        ("BUY XAUUSD @ 2655 SL 2650 TP 2670", "COMPLETE"),
+        ("SELL GOLD NOW", "ENTRY_ONLY"),
+        ("SL 2650 TP 2670", "PARAMS_ONLY"),
+    ])
+    def test_accepts_signals(self, parser, text, signal_type):
+        """Verify each signal type is accepted and matches parse()."""
+        signal = parser.parse_message(text)
+        assert signal is not None
+        assert signal.signal_type == signal_type
+        assert signal == parser.parse(text)
+
+    def test_rejects_chat_message(self, parser):
+        """Verify a message without a signal is rejected."""
+        assert parser.parse_message("Good morning traders!") is None
+
+    @pytest.mark.parametrize("text", [
+        "BUY XAUUSD STOP  LOSS 2650",
+        "STOP  LOSS 2650 TAKE  PROFIT 2700",
+    ])
+    def test_double_space_matches_gated_parse(self, parser, text):
+        """Verify "STOP  LOSS" (two spaces) agrees with the gated parse() path."""
+        expected = parser.parse(text) if parser.is_signal_message(text) else None
+        assert parser.parse_message(text) == expected
+
+
 class TestCopyBotPuneetScenarios:
     """Test the specific Copy Bot Puneet signal scenarios from the PRP"""
     
-    def setup_method(self):
-        self.parser = SignalParser()
-    
-    def test_scenario1_short_market(self):
+    def test_scenario1_short_market(self, parser):
         """Scenario 1: SHORT + MARKET"""
-        signal = self.parser.parse("Short market xau usd Sl - 4462 Tp1 -4401 Tp2 -4243")
+        signal = parser.parse("Short market xau usd Sl - 4462 Tp1 -4401 Tp2 -4243")
         
         assert signal is not None
         assert signal.action == "SELL", "SHORT should → SELL"
@@ -345,20 +374,20 @@ class TestCopyBotPuneetScenarios:
         assert signal.stop_loss == 4462.0
         assert signal.take_profit == 4401.0  # TP1 only
     
-    def test_scenario2_long_market(self):
+    def test_scenario2_long_market(self, parser):
         """Scenario 2: LONG + MARKET"""
-        signal = self.parser.parse("XAGUSD LONG market Sl 75.4 Tp - 78.921")
+        signal = parser.parse("XAGUSD LONG market Sl 75.4 Tp - 78.921")
         
         assert signal is not None
         assert signal.action == "BUY", "LONG should → BUY"
         assert signal.order_type == "MARKET"
         assert signal.symbol == "XAGUSD"
-        assert abs(signal.stop_loss - 75.4) < 0.01
-        assert abs(signal.take_profit - 78.921) < 0.01
+        assert signal.stop_loss == pytest.approx(75.4, abs=0.01)
+        assert signal.take_profit == pytest.approx(78.921, abs=0.01)
     
-    def test_scenario3_buy_limit(self):
+    def test_scenario3_buy_limit(self, parser):
         """Scenario 3: BUY LIMIT"""
-        signal = self.parser.parse("XAUUSD Buy Limit 4477 , Sl 4473 , Tp 4519")
+        signal = parser.parse("XAUUSD Buy Limit 4477 , Sl 4473 , Tp 4519")
         
         assert signal is not None
         assert signal.action == "BUY"
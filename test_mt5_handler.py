@@ -0,0 +1,139 @@
+"""
+MT5 Handler - Background Reconnect Tests
+========================================
+Tests for the reconnect path, run against an in-memory MetaTrader5 stand-in
+(the real package only installs on Windows next to a terminal).
+
+Run with: pytest test_mt5_handler.py -v
+"""
+
+import asyncio
+import importlib
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# Add trading_bot to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeMT5:
+    """Minimal MetaTrader5 module: a connection that can drop and hold initialize()"""
+
+    def __init__(self):
+        self.connected = False
+        self.init_calls = 0
+        self.shutdown_calls = 0
+        self.gate = threading.Event()  # initialize() blocks until set
+        self.gate.set()
+
+    def initialize(self, **kwargs):
+        self.init_calls += 1
+        self.gate.wait(timeout=5)
+        self.connected = True
+        return True
+
+    def last_error(self):
+        return (1, 'Fake error')
+
+    def account_info(self):
+        return SimpleNamespace(login=1, balance=1000.0) if self.connected else None
+
+    def symbols_total(self):
+        return 100
+
+    def shutdown(self):
+        self.shutdown_calls += 1
+        self.connected = False
+
+
+@pytest.fixture
+def fake_mt5(monkeypatch):
+    """Import mt5_handler against FakeMT5 and a stub config; returns (module, fake)"""
+    fake = FakeMT5()
+    config = SimpleNamespace(MT5_PATH='', MT5_LOGIN=0, MT5_PASSWORD='', MT5_SERVER='')
+    monkeypatch.setitem(sys.modules, 'MetaTrader5', fake)
+    monkeypatch.setitem(sys.modules, 'config', config)
+    sys.modules.pop('mt5_handler', None)
+    yield importlib.import_module('mt5_handler'), fake
+    sys.modules.pop('mt5_handler', None)
+
+
+async def _wait_for(condition, timeout=2.0):
+    """Poll condition() on the event loop until true (fails the test on timeout)"""
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("condition not reached")
+
+
+class TestBackgroundReconnect:
+    """Test 1: Dead connection fails fast and reconnects in the background"""
+
+    def test_outage_fails_fast_with_one_reconnect_task(self, fake_mt5):
+        """Verify orders fail fast, one task reconnects, initialized flips back."""
+        mt5_handler, fake = fake_mt5
+
+        async def scenario():
+            handler = mt5_handler.MT5Handler()
+            assert await handler.initialize()
+
+            fake.connected = False  # Connection drops
+            fake.gate.clear()       # Hold the reconnect attempt
+            result = await handler.place_order("BUY", "XAUUSD", 2640.0, 2660.0)
+            assert result == {'success': False, 'error': 'MT5 disconnected, reconnecting'}
+            assert not handler.initialized
+
+            result = await handler.place_order("BUY", "XAUUSD", 2640.0, 2660.0)
+            assert result == {'success': False, 'error': 'MT5 not initialized'}
+
+            await _wait_for(lambda: fake.init_calls == 2)
+            task = handler._reconnect_task
+            handler._schedule_reconnect()  # Another worker sees the same outage
+            await asyncio.sleep(0.05)
+            assert handler._reconnect_task is task
+
+            fake.gate.set()
+            await asyncio.wait_for(task, timeout=5)
+            assert handler.initialized
+            assert fake.init_calls == 2  # Initial connect + one reconnect
+
+        asyncio.run(scenario())
+
+    def test_shutdown_waits_for_inflight_reconnect(self, fake_mt5):
+        """Verify shutdown() lets a running attempt finish before mt5.shutdown()."""
+        mt5_handler, fake = fake_mt5
+
+        async def scenario():
+            handler = mt5_handler.MT5Handler()
+            assert await handler.initialize()
+
+            fake.connected = False
+            fake.gate.clear()
+            handler._schedule_reconnect()
+            await _wait_for(lambda: fake.init_calls == 2)
+
+            shutdown = asyncio.ensure_future(handler.shutdown())
+            await asyncio.sleep(0.05)
+            assert not shutdown.done()
+            assert fake.shutdown_calls == 0
+
+            fake.gate.set()  # The in-flight attempt succeeds late
+            await asyncio.wait_for(shutdown, timeout=5)
+            assert fake.shutdown_calls == 1
+            assert not handler.initialized
+
+            handler._schedule_reconnect()  # No reconnects after shutdown
+            await asyncio.sleep(0.05)
+            assert fake.init_calls == 2
+
+        asyncio.run(scenario())
+
+
+# === Run tests directly ===
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])